@@ -8,13 +8,21 @@
 
 """Network plugin."""
 
-import psutil
-import netifaces
+import contextlib
+import functools
+import marshal
 import os
+import socket
+import sys
 from datetime import datetime
 
+import psutil
+
+from glances.config import user_cache_dir
+from glances.globals import safe_makedirs
 from glances.logger import logger
 from glances.plugins.plugin.model import GlancesPluginModel
+from glances.timer import Timer, getTimeSinceLastUpdate
 
 # Fields description
 # description: human readable description
@@ -66,6 +74,222 @@ items_history_list = [
 ]
 
 
+# Interfaces status (net_if_stats) and addresses (net_if_addrs) change rarely,
+# they are only refreshed every NET_IF_CACHE_TTL seconds (or when a new interface appears).
+# Keep it short: the up/down status (hide_no_up option) is read from this cache.
+NET_IF_CACHE_TTL = 5
+
+# Length (in hex digits) of the IEEE MA-S (36 bits), MA-M (28 bits) and MA-L (24 bits)
+# assignments, longest first because a MA-M/MA-S block overrides its parent MA-L
+OUI_PREFIX_LENGTHS = (9, 7, 6)
+
+# Vendor name of the MAC addresses not found in the vendor database (single shared object)
+UNKNOWN_VENDOR = sys.intern('Unknown Vendor')
+
+# Directory of the plugin and vendor database shipped with it
+PLUGIN_DIR = os.path.dirname(os.path.abspath(__file__))
+VENDOR_DB_PATH = os.path.join(PLUGIN_DIR, 'ieee-oui.txt')
+
+# Name of the binary (marshal) copy of the parsed VENDOR_DB_PATH, stored in the user cache dir
+VENDOR_DB_CACHE_FILE = 'ieee-oui.marshal'
+
+# Delay (in seconds) before looking again for a vendor database that was not found
+VENDOR_DB_RETRY_DELAY = 60
+
+# Vendor database returned when no database file is available (shared, never modified)
+EMPTY_VENDOR_DB = {}
+
+# Resolved vendor database paths (see find_vendor_database)
+# and Timer of the ones not found, until the next probe
+_vendor_db_paths = {}
+_vendor_db_missing = {}
+
+
+def find_vendor_database(file_path="ieee-oui.txt"):
+    """Return the path of the vendor database file or None if it can not be found.
+
+    Found paths are remembered, so the candidate locations are only probed once.
+    Missing files are probed again at most every VENDOR_DB_RETRY_DELAY seconds.
+    """
+    if file_path in _vendor_db_paths:
+        return _vendor_db_paths[file_path]
+    if file_path in _vendor_db_missing and not _vendor_db_missing[file_path].finished():
+        return None
+
+    # First try to find the file in the same directory as the plugin
+    possible_paths = [
+        os.path.join(PLUGIN_DIR, file_path),
+        os.path.join(PLUGIN_DIR, '..', file_path),
+        os.path.join(PLUGIN_DIR, '..', '..', file_path),
+        file_path,  # Try absolute path last
+    ]
+    for path in possible_paths:
+        logger.debug(f"Trying vendor database path: {path}")
+        if os.path.exists(path):
+            _vendor_db_missing.pop(file_path, None)
+            path = _vendor_db_paths[file_path] = os.path.abspath(path)
+            return path
+    logger.debug(f"Vendor database {file_path} not found in any expected location")
+    _vendor_db_missing[file_path] = Timer(VENDOR_DB_RETRY_DELAY)
+    return None
+
+
+def load_vendor_database(file_path):
+    """
+    Load the vendor database from the given file (ieee-oui.txt format).
+    Each line is in the format: <OUI><TAB><Vendor>
+
+    file_path can also be an already opened (text or binary) file object.
+    """
+    logger.debug(f"Loading vendor database from: {file_path}")
+    vendor_dict = {}
+    vendor_names = {}
+    try:
+        # One read and one decode, the lines are then split by str.splitlines (C loop)
+        if hasattr(file_path, 'read'):
+            data = file_path.read()
+        else:
+            with open(file_path, 'rb') as file:
+                data = file.read()
+    except OSError as e:
+        logger.debug(f"Error loading vendor database: {e}")
+        return vendor_dict
+    if isinstance(data, bytes):
+        data = data.decode('utf-8', 'replace')
+    for line in data.splitlines():
+        mac_prefix, sep, vendor_name = line.partition('\t')
+        # Skip blank lines, comments and lines without vendor
+        if not sep or mac_prefix.startswith('#'):
+            continue
+        mac_prefix = mac_prefix.strip()
+        if len(mac_prefix) in OUI_PREFIX_LENGTHS:  # Only store valid MA-L/MA-M/MA-S prefixes
+            # Many prefixes belong to the same vendor: share a single string per vendor name
+            vendor_name = vendor_name.split('\t', 1)[0].strip()
+            vendor_dict[mac_prefix.upper()] = vendor_names.setdefault(vendor_name, vendor_name)
+    logger.debug(f"Loaded {len(vendor_dict)} vendor entries")
+    return vendor_dict
+
+
+def load_vendor_database_cache(file_path, mtime):
+    """Return the parsed vendor database from the binary cache file.
+
+    Return None if the cache file does not exist or was not built from
+    file_path at the given mtime.
+    """
+    cache_file = os.path.join(user_cache_dir()[0], VENDOR_DB_CACHE_FILE)
+    try:
+        with open(cache_file, 'rb') as f:
+            # Note: loads() on the whole content is much faster than load() on the file object
+            cached_path, cached_mtime, vendor_dict = marshal.loads(f.read())
+    except Exception as e:
+        logger.debug(f"Cannot read vendor database from cache file: {cache_file} ({e})")
+        return None
+    if cached_path != file_path or cached_mtime != mtime or not isinstance(vendor_dict, dict):
+        logger.debug(f"Vendor database cache file {cache_file} is outdated")
+        return None
+    return vendor_dict
+
+
+def save_vendor_database_cache(file_path, mtime, vendor_dict):
+    """Save the parsed vendor database to the binary cache file.
+
+    The file is written under a temporary name and then renamed, so a concurrent
+    Glances instance never reads a partially written cache.
+    """
+    cache_dir = user_cache_dir()[0]
+    cache_file = os.path.join(cache_dir, VENDOR_DB_CACHE_FILE)
+    tmp_file = f'{cache_file}.{os.getpid()}.tmp'
+    try:
+        safe_makedirs(cache_dir)
+        with open(tmp_file, 'wb') as f:
+            f.write(marshal.dumps((file_path, mtime, vendor_dict)))
+        os.replace(tmp_file, cache_file)
+    except Exception as e:
+        logger.debug(f"Cannot write vendor database to cache file {cache_file} ({e})")
+        with contextlib.suppress(OSError):
+            os.remove(tmp_file)
+
+
+def get_vendor_db(file_path="ieee-oui.txt"):
+    """Return the vendor database.
+
+    The file is only parsed on the first call (or when its mtime changes),
+    so all the plugin instances share the same dict. The database shipped
+    with the plugin is also cached on disk (marshal), to skip the text
+    parsing when Glances starts.
+    """
+    path = find_vendor_database(file_path)
+    if path is None:
+        return EMPTY_VENDOR_DB
+
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        # The file has been removed since it was found
+        del _vendor_db_paths[file_path]
+        return EMPTY_VENDOR_DB
+    return _get_vendor_db(path, mtime)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_vendor_db(path, mtime):
+    """Return the vendor database of the given file version (see get_vendor_db).
+
+    The mtime is part of the cache key, so an updated file is parsed again.
+    """
+    vendor_dict = None
+    if path == VENDOR_DB_PATH:
+        vendor_dict = load_vendor_database_cache(path, mtime)
+    if vendor_dict is None:
+        vendor_dict = load_vendor_database(path)
+        if path == VENDOR_DB_PATH and vendor_dict:
+            save_vendor_database_cache(path, mtime, vendor_dict)
+    return vendor_dict
+
+
+# Translation table mapping the '-' and '.' MAC address delimiters to ':'
+_MAC_DELIMITERS = str.maketrans('-.', '::')
+
+
+@functools.lru_cache(maxsize=256)
+def normalize_mac(mac):
+    """Return the MAC address as an upper-case hex string without delimiters.
+
+    Interface MAC addresses are stable, so the result is memoized.
+    """
+    # Fast path for the canonical xx:xx:xx:xx:xx:xx form returned by psutil
+    if len(mac) == 17 and mac[2::3] == ':::::':
+        return mac.replace(':', '').upper()
+    # Use ':' as the only delimiter (single C-level pass)
+    mac = mac.translate(_MAC_DELIMITERS)
+    # Handle both delimited and non-delimited formats
+    if ':' in mac:
+        # Split into bytes and pad each with leading zeros
+        return ''.join(byte.zfill(2) for byte in mac.split(':')).upper()
+    # Already in non-delimited format
+    return mac.upper()
+
+
+def get_vendor(mac, vendor_db):
+    """
+    Match the MAC address prefix with the vendor database.
+    The database uses 6 (MA-L), 7 (MA-M) or 9 (MA-S) character hex values
+    without delimiters, the longest matching prefix wins.
+    """
+    try:
+        normalized_mac = normalize_mac(mac)
+    except (AttributeError, TypeError):
+        # Not a MAC address string
+        return UNKNOWN_VENDOR
+
+    # Look up the vendor, longest prefix first (MA-S, MA-M then MA-L)
+    for prefix_length in OUI_PREFIX_LENGTHS:
+        vendor = vendor_db.get(normalized_mac[:prefix_length])
+        if vendor:
+            return vendor
+    return UNKNOWN_VENDOR
+
+
 class PluginModel(GlancesPluginModel):
     """Glances network plugin.
 
@@ -82,18 +306,42 @@ class PluginModel(GlancesPluginModel):
             stats_init_value=[],
         )
 
-        # Set up debug logging
-        self.debug_log = os.path.join(os.getcwd(), 'logs', 'network_debug.log')
-        os.makedirs(os.path.dirname(self.debug_log), exist_ok=True)
-        with open(self.debug_log, 'w') as f:
-            f.write(f"=== Network Plugin Debug Log Started at {datetime.now()} ===\n\n")
-
         # Set debug mode flag (default to False)
         self.debug_mode = False
 
+        # Debug log file, only created by the first debug_log_write() call
+        self.debug_log = os.path.join(os.getcwd(), 'logs', 'network_debug.log')
+        self._debug_log_started = False
+
         # We want to display the stat in the curse interface
         self.display_curse = True
 
+        # Cache for the interfaces status and addresses (see get_net_if_info)
+        self._net_if_timer = Timer(0)
+        self._net_if_names = set()
+        self._net_status = {}
+        self._net_addrs = {}
+        # MAC addresses extracted from _net_addrs, only for the displayed interfaces (see get_mac_address)
+        self._net_macs = {}
+        self._net_no_ip = set()
+
+        # Rx/Tx messages formatted by update_views for the (byte, network_cumul) display options
+        self._rates_msg = {}
+        self._rates_msg_args = None
+
+        # Vendor database used by the last update and {mac_address: vendor} of its interfaces
+        self._vendor_db = None
+        self._vendors = {}
+
+        # is_display result per interface name (see update_local)
+        self._displayed = {}
+
+        # Interface names without alias suffix, computed by update_views
+        self._real_names = {}
+
+        # True for the interfaces whose hide_zero_fields are all hidden, computed by update_views
+        self._hidden = {}
+
         # Hide stats if it has never been != 0
         if config is not None:
             self.hide_zero = config.get_bool_value(self.plugin_name, 'hide_zero', default=False)
@@ -106,14 +354,37 @@ class PluginModel(GlancesPluginModel):
         self.hide_no_up = config.get_bool_value(self.plugin_name, 'hide_no_up', default=False)
         self.hide_no_ip = config.get_bool_value(self.plugin_name, 'hide_no_ip', default=False)
 
-        # Force a first update because we need two updates to have the first stat
-        self.update()
+        # We need two samples to have the first rates: only record the counters
+        # here instead of forcing a full first update
+        self.init_rates()
         self.refresh_timer.set(0)
 
     def get_key(self):
         """Return the key of the list."""
         return 'interface_name'
 
+    def init_rates(self):
+        """Record the current counters as the previous stats used by the rates computation."""
+        try:
+            net_io_counters = psutil.net_io_counters(pernic=True)
+        except OSError:
+            return
+
+        # Start the elapsed time measurement of the rates
+        getTimeSinceLastUpdate(self.plugin_name)
+
+        # Only the gauges are read by _manage_rate from the previous stats
+        key = self.get_key()
+        self.stats_previous = [
+            {
+                key: interface_name,
+                'bytes_recv_gauge': interface_stat.bytes_recv,
+                'bytes_sent_gauge': interface_stat.bytes_sent,
+                'bytes_all_gauge': interface_stat.bytes_sent + interface_stat.bytes_recv,
+            }
+            for interface_name, interface_stat in net_io_counters.items()
+        ]
+
     # @GlancesPluginModel._check_decorator
     @GlancesPluginModel._log_result_decorator
     def update(self):
@@ -133,16 +404,9 @@ class PluginModel(GlancesPluginModel):
 
     @GlancesPluginModel._manage_rate
     def update_local(self):
-        self.debug_log_write("\n=== Starting update_local() ===")
+        if self.debug_mode:
+            self.debug_log_write("\n=== Starting update_local() ===")
         # Update stats using the standard system lib
-        stats = self.get_init_value()
-
-        # Load vendor database
-        vendor_db = self.load_vendor_database()
-        
-        # Get MAC addresses for all interfaces
-        mac_addresses = self.get_mac_addresses()
-
         # Grab network interface stat using the psutil net_io_counter method
         # Example:
         # { 'veth4cbf8f0a': snetio(
@@ -151,55 +415,135 @@ class PluginModel(GlancesPluginModel):
         #   errin=0, errout=0, dropin=0, dropout=0), ... }
         try:
             net_io_counters = psutil.net_io_counters(pernic=True)
-            net_status = psutil.net_if_stats()
-            net_addrs = psutil.net_if_addrs()
+            net_status, no_ip_interfaces = self.get_net_if_info(net_io_counters)
         except OSError as e:
             logger.debug(f"Cannot retrieve network stats: {e}")
             return self.stats
-    
-        # Load vendor database once (cache for efficiency)
-        if not hasattr(self, '_vendor_db'):
-            self._vendor_db = self.load_vendor_database("ieee-oui.txt")
-    
-        for interface_name, interface_stat in net_io_counters.items():
-            if not self.is_display(interface_name) or interface_name not in net_status:
-                continue
-    
-            stat = self.filter_stats(interface_stat)
-            stat.update(self.filter_stats(net_status[interface_name]))
-            stat['key'] = self.get_key()
-            stat['interface_name'] = interface_name
-            stat['alias'] = self.has_alias(interface_name)
-            stat['bytes_all'] = stat['bytes_sent'] + stat['bytes_recv']
-
-            # Add vendor information if MAC address is available
-            if interface_name in mac_addresses:
-                stat['vendor'] = self.get_vendor(mac_addresses[interface_name], vendor_db)
-            else:
-                stat['vendor'] = "Unknown"
 
-            # Interface speed in Mbps, convert it to bps
-            # Can be always 0 on some OSes
-            stat['speed'] = stat['speed'] * 1048576
-    
-            # Add MAC address and vendor name
-            mac_info = net_addrs.get(interface_name, [])
-            mac_address = next((addr.address for addr in mac_info if addr.family == psutil.AF_LINK), "N/A")
-            stat['mac_address'] = mac_address
-            stat['vendor'] = self.get_vendor(mac_address, self._vendor_db)
-    
-            stats.append(stat)
-    
+        # The show/hide regexps only depend on the interface name: keep the
+        # is_display result of the interfaces that were already there
+        # (interfaces without status are skipped below, do not match them at all)
+        previous = self._displayed
+        self._displayed = {
+            interface_name: previous[interface_name] if interface_name in previous else self.is_display(interface_name)
+            for interface_name in net_io_counters
+            if interface_name in net_status
+        }
+
+        # Interfaces to display: (name, io counters, status, MAC address)
+        # The MAC address is only looked up once the interface passed all the filters
+        # Do not take hidden interface into account
+        # or KeyError: 'eth0' when interface is not connected #1348
+        # Skip interfaces that are down or without IP address if configured (#2799)
+        get_mac_address = self.get_mac_address
+        interfaces = [
+            (interface_name, interface_stat, net_status[interface_name], get_mac_address(interface_name))
+            for interface_name, interface_stat in net_io_counters.items()
+            if interface_name in net_status
+            and self._displayed[interface_name]
+            and not (self.hide_no_up and not net_status[interface_name].isup)
+            and not (self.hide_no_ip and interface_name in no_ip_interfaces)
+        ]
+
+        # Vendor database is shared by all the instances (only parsed once)
+        # and only loaded when a MAC address has to be resolved
+        if any(mac_address != "N/A" for _, _, _, mac_address in interfaces):
+            vendor_db = get_vendor_db()
+        else:
+            vendor_db = EMPTY_VENDOR_DB
+
+        # Vendor names are memoized per MAC address until the vendor database changes
+        if vendor_db is not self._vendor_db:
+            self._vendor_db = vendor_db
+            self._vendors = {}
+        vendors = self._vendors
+
+        # Build all the stats in one pass
+        # Fields are read straight from the psutil namedtuples (no _asdict()/filter_stats round trip)
+        key = self.get_key()
+        stats = [
+            {
+                'bytes_sent': interface_stat.bytes_sent,
+                'bytes_recv': interface_stat.bytes_recv,
+                # Interface speed in Mbps (int), convert it to bps (x 1048576)
+                # Can be always 0 on some OSes
+                'speed': interface_status.speed << 20,
+                'is_up': interface_status.isup,
+                'key': key,
+                'interface_name': interface_name,
+                'alias': self.has_alias(interface_name),
+                'bytes_all': interface_stat.bytes_sent + interface_stat.bytes_recv,
+                'mac_address': mac_address,
+                'vendor': vendors[mac_address] if mac_address in vendors else get_vendor(mac_address, vendor_db),
+            }
+            for interface_name, interface_stat, interface_status, mac_address in interfaces
+        ]
+
+        # Only keep the MAC addresses of the current interfaces
+        self._vendors = {stat['mac_address']: stat['vendor'] for stat in stats}
+
         return stats
 
+    def get_net_if_info(self, net_io_counters):
+        """Return the interfaces status and the set of interfaces without IP address.
+
+        Status comes from psutil net_if_stats. Interfaces without IPv4/IPv6 address
+        are extracted once from net_if_addrs. All are cached for NET_IF_CACHE_TTL
+        seconds. The cache is refreshed sooner if an interface of net_io_counters
+        was not there at the last refresh (interfaces without status, see #1348,
+        do not force a refresh on each update).
+        """
+        if self._net_if_timer.finished() or not net_io_counters.keys() <= self._net_if_names:
+            self._net_if_names = set(net_io_counters)
+            self._net_status = psutil.net_if_stats()
+            self._net_addrs = psutil.net_if_addrs()
+            self._net_macs = {}
+            self._net_no_ip = {
+                interface_name
+                for interface_name, addrs in self._net_addrs.items()
+                if not any(addr.family in (socket.AF_INET, socket.AF_INET6) for addr in addrs)
+            }
+            self._net_if_timer.reset(NET_IF_CACHE_TTL)
+        return self._net_status, self._net_no_ip
+
+    def get_mac_address(self, interface_name):
+        """Return the MAC address of the interface ("N/A" if none).
+
+        Extracted from the cached net_if_addrs on first request, until the next refresh.
+        """
+        if interface_name not in self._net_macs:
+            self._net_macs[interface_name] = next(
+                (addr.address for addr in self._net_addrs.get(interface_name, ()) if addr.family == psutil.AF_LINK),
+                "N/A",
+            )
+        return self._net_macs[interface_name]
+
     def update_views(self):
         """Update stats views."""
         # Call the father's method
         super().update_views()
 
-        # Add specifics information
-        # Alert
+        # Add specifics information, in a single pass over the interfaces
+        key = self.get_key()
+        self._real_names = {}
+        self._hidden = {}
+        if self.args is not None:
+            # Rx/Tx messages are formatted once per update (msg_curse can be called several times per update)
+            self._rates_msg = {}
+            self._rates_msg_args = (self.args.byte, self.args.network_cumul)
+            cumul = self.args.network_cumul
+            to_bit, unit = self.get_rates_unit(self.args)
         for i in self.get_raw():
+            # Interface name without the alias suffix (eth0:1 => eth0), also used by msg_curse
+            if_real_name = self._real_names[i[key]] = i['interface_name'].split(':', 1)[0]
+
+            # Hide stats if never be different from 0 (issue #1787), checked once per update for msg_curse
+            self._hidden[i[key]] = self.is_hidden(i[key])
+
+            if self.args is not None:
+                self._rates_msg[i[key]] = self.get_rates_msg(i, cumul, to_bit, unit)
+
+            # Alert
             # Skip alert if no timespan to measure
             if 'bytes_recv_rate_per_sec' not in i or 'bytes_sent_rate_per_sec' not in i:
                 continue
@@ -209,7 +553,6 @@ class PluginModel(GlancesPluginModel):
             bps_tx = int(i['bytes_sent_rate_per_sec'] * 8)
 
             # Decorate the bitrate with the configuration file thresholds
-            if_real_name = i['interface_name'].split(':')[0]
             alert_rx = self.get_alert(bps_rx, header=if_real_name + '_rx')
             alert_tx = self.get_alert(bps_tx, header=if_real_name + '_tx')
 
@@ -221,137 +564,65 @@ class PluginModel(GlancesPluginModel):
                 alert_tx = self.get_alert(current=bps_tx, maximum=i['speed'], header='tx')
 
             # then decorates
-            self.views[i[self.get_key()]]['bytes_recv']['decoration'] = alert_rx
-            self.views[i[self.get_key()]]['bytes_sent']['decoration'] = alert_tx
-
-    def get_mac_addresses(self):
-        self.debug_log_write("Getting MAC addresses...")
-        mac_dict = {}
-        try:
-            logger.debug("Getting MAC addresses for interfaces...")
-            for interface in netifaces.interfaces():
-                logger.debug(f"Getting MAC for interface: {interface}")
-                self.debug_log_write(f"Checking interface: {interface}")
-                try:
-                    addrs = netifaces.ifaddresses(interface)
-                    self.debug_log_write(f"Interface {interface} addresses: {addrs}")
-                    mac = addrs.get(netifaces.AF_LINK)
-                    if mac:
-                        mac_dict[interface] = mac[0]['addr']
-                        self.debug_log_write(f"Found MAC for {interface}: {mac[0]['addr']}")
-                    else:
-                        self.debug_log_write(f"No MAC found for {interface}")
-                except Exception as e:
-                    self.debug_log_write(f"Error getting MAC for {interface}: {str(e)}")
-        except Exception as e:
-            self.debug_log_write(f"Error in get_mac_addresses: {str(e)}")
-        self.debug_log_write(f"Final MAC dictionary: {mac_dict}")
-        return mac_dict
+            view = self.views[i[key]]
+            view['bytes_recv']['decoration'] = alert_rx
+            view['bytes_sent']['decoration'] = alert_tx
+
+    def is_hidden(self, item):
+        """Return True if all the hide_zero_fields of the interface item are hidden."""
+        return all(self.get_views(item=item, key=f, option='hidden') for f in self.hide_zero_fields)
+
+    @staticmethod
+    def get_rates_unit(args):
+        """Return the (to_bit, unit) pair used to format the Rx/Tx messages."""
+        if args.byte:
+            # Bytes per second (for dummy)
+            return 1, ''
+        # Bits per second (for real network administrator | Default)
+        return 8, 'b'
+
+    def get_rates_msg(self, stat, cumul, to_bit, unit):
+        """Return the (Rx, Tx, Rx+Tx) messages of the interface stat.
+
+        Cumulative or bitrate according to cumul, None if not available yet.
+        """
+        if cumul and 'bytes_recv' in stat:
+            fields = ('bytes_recv', 'bytes_sent', 'bytes_all')
+        elif 'bytes_recv_rate_per_sec' in stat:
+            fields = ('bytes_recv_rate_per_sec', 'bytes_sent_rate_per_sec', 'bytes_all_rate_per_sec')
+        else:
+            return None
+        auto_unit = self.auto_unit
+        return tuple(auto_unit(int(stat[field] * to_bit)) + unit for field in fields)
 
     def load_vendor_database(self, file_path="ieee-oui.txt"):
+        """Return the (cached) vendor database loaded from file_path.
+
+        File objects are parsed directly, without caching.
         """
-        Load the vendor database from the ieee-oui.txt file.
-        Each line is in the format: <OUI><TAB><Vendor>
-        """
-        self.debug_log_write(f"Loading vendor database from: {file_path}")
-        vendor_dict = {}
-        try:
-            # First try to find the file in the same directory as the plugin
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            possible_paths = [
-                os.path.join(current_dir, file_path),
-                os.path.join(current_dir, '..', file_path),
-                os.path.join(current_dir, '..', '..', file_path),
-                file_path  # Try absolute path last
-            ]
-            
-            file_found = False
-            for path in possible_paths:
-                self.debug_log_write(f"Trying path: {path}")
-                if os.path.exists(path):
-                    self.debug_log_write(f"Found database at: {path}")
-                    file_found = True
-                    with open(path, "r", encoding='utf-8') as file:
-                        for line_num, line in enumerate(file, 1):
-                            try:
-                                line = line.strip()
-                                if not line or line.startswith('#'):
-                                    continue
-                                    
-                                parts = line.split("\t")
-                                if len(parts) >= 2:
-                                    mac_prefix = parts[0].strip().upper()
-                                    vendor_name = parts[1].strip()
-                                    if len(mac_prefix) == 6:  # Only store valid 6-character prefixes
-                                        vendor_dict[mac_prefix] = vendor_name
-                                        self.debug_log_write(f"Added vendor entry: {mac_prefix} -> {vendor_name}")
-                            except Exception as e:
-                                self.debug_log_write(f"Error parsing line {line_num}: {str(e)}")
-                    break
-                    
-            if not file_found:
-                self.debug_log_write("Database file not found in any expected location")
-                
-            self.debug_log_write(f"Loaded {len(vendor_dict)} vendor entries")
-        except Exception as e:
-            self.debug_log_write(f"Error loading vendor database: {str(e)}")
-        return vendor_dict
+        if hasattr(file_path, 'read'):
+            return load_vendor_database(file_path)
+        return get_vendor_db(file_path)
 
     def get_vendor(self, mac, vendor_db):
-        """
-        Match the MAC address prefix with the vendor database.
-        The database uses 6-character hex values without delimiters.
-        """
-        if self.debug_mode:
-            self.debug_log_write(f"\n{'='*50}")
-            self.debug_log_write(f"Looking up vendor for MAC: {mac}")
-        
-        try:
-            # Step 1: Handle both delimited and non-delimited formats
-            if ':' in mac or '-' in mac or '.' in mac:
-                # Split into bytes and pad each with leading zeros
-                bytes_list = mac.replace('-', ':').replace('.', ':').split(':')
-                if self.debug_mode:
-                    self.debug_log_write(f"Split into bytes: {bytes_list}")
-                
-                # Pad each byte with leading zeros
-                normalized_bytes = [byte.zfill(2) for byte in bytes_list]
-                if self.debug_mode:
-                    self.debug_log_write(f"Normalized bytes: {normalized_bytes}")
-                
-                # Take first three bytes and join
-                mac_prefix = ''.join(normalized_bytes[:3]).upper()
-                if self.debug_mode:
-                    self.debug_log_write(f"Final MAC prefix from bytes: {mac_prefix}")
-            else:
-                # Already in non-delimited format
-                cleaned_mac = mac.upper()
-                mac_prefix = cleaned_mac[:6]
-                if self.debug_mode:
-                    self.debug_log_write(f"Final MAC prefix from raw: {mac_prefix}")
-            
-            # Look up the vendor
-            vendor = vendor_db.get(mac_prefix)
-            if vendor:
-                if self.debug_mode:
-                    self.debug_log_write(f"Found vendor: {vendor}")
-                return vendor
-            
-            if self.debug_mode:
-                self.debug_log_write(f"No vendor found for prefix: {mac_prefix}")
-            return "Unknown Vendor"
-                
-        except Exception as e:
-            if self.debug_mode:
-                self.debug_log_write(f"Error in get_vendor: {str(e)}")
-            return "Unknown Vendor"
+        """Return the vendor name of the MAC address (see the get_vendor function)."""
+        return get_vendor(mac, vendor_db)
 
     def debug_log_write(self, message):
-        """Write debug message to the log file."""
+        """Write debug message to the log file.
+
+        Callers check self.debug_mode first, so the message is not even built
+        when the debug mode is disabled.
+        """
         if not self.debug_mode:
             return
-            
+
         try:
+            if not self._debug_log_started:
+                os.makedirs(os.path.dirname(self.debug_log), exist_ok=True)
+                with open(self.debug_log, 'w') as f:
+                    f.write(f"=== Network Plugin Debug Log Started at {datetime.now()} ===\n\n")
+                self._debug_log_started = True
             with open(self.debug_log, 'a') as f:
                 f.write(f"[{datetime.now()}] {message}\n")
         except Exception as e:
@@ -380,9 +651,14 @@ class PluginModel(GlancesPluginModel):
         msg = '{:>15}'.format('VENDOR')
         ret.append(self.curse_add_line(msg))
 
-        if args.network_cumul:
+        # Display options, invariant for the whole interface loop
+        cumul = args.network_cumul
+        summ = args.network_sum
+        to_bit, unit = self.get_rates_unit(args)
+
+        if cumul:
             # Cumulative stats
-            if args.network_sum:
+            if summ:
                 # Sum stats
                 msg = '{:>14}'.format('Rx+Tx')
                 ret.append(self.curse_add_line(msg))
@@ -394,7 +670,7 @@ class PluginModel(GlancesPluginModel):
                 ret.append(self.curse_add_line(msg))
         else:
             # Bitrate stats
-            if args.network_sum:
+            if summ:
                 # Sum stats
                 msg = '{:>14}'.format('Rx+Tx/s')
                 ret.append(self.curse_add_line(msg))
@@ -404,75 +680,62 @@ class PluginModel(GlancesPluginModel):
                 msg = '{:>7}'.format('Tx/s')
                 ret.append(self.curse_add_line(msg))
     
+        if self._rates_msg_args == (args.byte, cumul):
+            rates_msg = self._rates_msg
+        else:
+            rates_msg = {}
+
+        # Local bindings for the interface loop
+        get_views = self.get_views
+        add_line = self.curse_add_line
+        new_line = self.curse_new_line
+        key = self.get_key()
+        hidden = self._hidden
+
         # Interface list (sorted by name)
         for i in self.sorted_stats():
             # Do not display interface in down state (issue #765)
             if ('is_up' in i) and (i['is_up'] is False):
                 continue
+            item = i[key]
             # Hide stats if never be different from 0 (issue #1787)
-            if all(self.get_views(item=i[self.get_key()], key=f, option='hidden') for f in self.hide_zero_fields):
+            if hidden[item] if item in hidden else self.is_hidden(item):
                 continue
             # Format stats
             # Is there an alias for the interface name?
-            if i['alias'] is None:
-                if_name = i['interface_name'].split(':')[0]
-            else:
+            if i['alias'] is not None:
                 if_name = i['alias']
+            elif item in self._real_names:
+                if_name = self._real_names[item]
+            else:
+                if_name = i['interface_name'].split(':', 1)[0]
             if len(if_name) > name_max_width:
                 # Cut interface name if it is too long
                 if_name = '_' + if_name[-name_max_width + 1:]
     
-            # Add vendor information
-            vendor = i.get('vendor', 'Unknown Vendor')
-    
-            if args.byte:
-                # Bytes per second (for dummy)
-                to_bit = 1
-                unit = ''
-            else:
-                # Bits per second (for real network administrator | Default)
-                to_bit = 8
-                unit = 'b'
-    
-            if args.network_cumul and 'bytes_recv' in i:
-                rx = self.auto_unit(int(i['bytes_recv'] * to_bit)) + unit
-                tx = self.auto_unit(int(i['bytes_sent'] * to_bit)) + unit
-                ax = self.auto_unit(int(i['bytes_all'] * to_bit)) + unit
-            elif 'bytes_recv_rate_per_sec' in i:
-                rx = self.auto_unit(int(i['bytes_recv_rate_per_sec'] * to_bit)) + unit
-                tx = self.auto_unit(int(i['bytes_sent_rate_per_sec'] * to_bit)) + unit
-                ax = self.auto_unit(int(i['bytes_all_rate_per_sec'] * to_bit)) + unit
+            # Rx/Tx messages (precomputed by update_views if the display options did not change)
+            if item in rates_msg:
+                rates = rates_msg[item]
             else:
+                rates = self.get_rates_msg(i, cumul, to_bit, unit)
+            if rates is None:
                 # Avoid issue when a new interface is created on the fly
                 # Example: start Glances, then start a new container
                 continue
+            rx, tx, ax = rates
     
-            # New line
-            ret.append(self.curse_new_line())
-            # Include vendor in the display line
-            msg = f'{if_name} ({vendor})'
-            ret.append(self.curse_add_line(msg))
-
-            # Add vendor information
-            vendor = i.get('vendor', 'Unknown')[:15]  # Truncate to 15 chars
-            msg = '{:>15}'.format(vendor)
-            ret.append(self.curse_add_line(msg))
-
-            if args.network_sum:
-                msg = f'{ax:>14}'
-                ret.append(self.curse_add_line(msg))
+            # New line with the interface name and its vendor (truncated to 15 chars)
+            vendor = (i.get('vendor') or UNKNOWN_VENDOR)[:15]
+            ret.extend((new_line(), add_line(f'{if_name:{name_max_width}}'), add_line(f'{vendor:>15}')))
+
+            if summ:
+                ret.append(add_line(f'{ax:>14}'))
             else:
-                msg = f'{rx:>7}'
-                ret.append(
-                    self.curse_add_line(
-                        msg, self.get_views(item=i[self.get_key()], key='bytes_recv', option='decoration')
-                    )
-                )
-                msg = f'{tx:>7}'
-                ret.append(
-                    self.curse_add_line(
-                        msg, self.get_views(item=i[self.get_key()], key='bytes_sent', option='decoration')
+                ret.extend(
+                    (
+                        add_line(f'{rx:>7}', get_views(item=item, key='bytes_recv', option='decoration')),
+                        add_line(f'{tx:>7}', get_views(item=item, key='bytes_sent', option='decoration')),
                     )
                 )
-    
+
         return ret
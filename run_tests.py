@@ -1,9 +1,54 @@
 #!/usr/bin/env python3
 
+import json
 import unittest
 import sys
 import os
 
+# Test ids found by the last discovery, reused while the tests tree is unchanged
+CACHE_FILE = '.unittest_cache'
+
+def tests_mtime(start_dir):
+    """Return the most recent mtime of the tests tree (files and directories).
+
+    __pycache__ directories are skipped: they are written by the discovery itself.
+    """
+    mtime = 0
+    for root, dirs, files in os.walk(start_dir):
+        dirs[:] = [d for d in dirs if d != '__pycache__']
+        mtime = max([mtime, os.stat(root).st_mtime_ns] + [os.stat(os.path.join(root, f)).st_mtime_ns for f in files])
+    return mtime
+
+def iter_test_ids(suite):
+    """Yield the ids of all the test cases of the suite."""
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from iter_test_ids(test)
+        else:
+            yield test.id()
+
+def load_tests(loader, start_dir, top_level_dir):
+    """Discover the tests, or load them by id if the tests tree did not change."""
+    cache_file = os.path.join(top_level_dir, CACHE_FILE)
+    mtime = tests_mtime(start_dir)
+    try:
+        with open(cache_file) as f:
+            cache = json.load(f)
+        if cache['mtime'] == mtime:
+            return loader.loadTestsFromNames(cache['ids'])
+    except (OSError, ValueError, KeyError):
+        pass
+
+    suite = loader.discover(start_dir, pattern='test_*.py', top_level_dir=top_level_dir)
+    # Do not cache a discovery with import errors, they have no id to reload
+    if not loader.errors:
+        try:
+            with open(cache_file, 'w') as f:
+                json.dump({'mtime': mtime, 'ids': list(iter_test_ids(suite))}, f)
+        except OSError:
+            pass
+    return suite
+
 def run_tests():
     """Run all test suites."""
     # Get the directory containing this script
@@ -15,7 +60,7 @@ def run_tests():
     # Discover and run tests
     loader = unittest.TestLoader()
     start_dir = os.path.join(test_dir, 'tests')
-    suite = loader.discover(start_dir, pattern='test_*.py')
+    suite = load_tests(loader, start_dir, test_dir)
     
     runner = unittest.TextTestRunner(verbosity=2)
     result = runner.run(suite)
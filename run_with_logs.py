@@ -1,5 +1,6 @@
 import os
 import datetime
+import selectors
 import subprocess
 import threading
 import time
@@ -15,41 +16,30 @@ log_file = f'logs/glances_log_{timestamp}.txt'
 
 def log_output(process, log_file):
     """Log output from process to file in real-time"""
-    with open(log_file, 'a') as f:
-        # Create buffers for stdout and stderr
-        stdout_buffer = []
-        stderr_buffer = []
-        
-        while True:
-            # Read output lines
-            stdout_line = process.stdout.readline()
-            stderr_line = process.stderr.readline()
-            
-            if stdout_line:
-                stdout_buffer.append(stdout_line)
-                if stdout_line.endswith('\n'):
-                    f.write(f"[STDOUT] {''.join(stdout_buffer)}")
-                    f.flush()
-                    stdout_buffer = []
-            
-            if stderr_line:
-                stderr_buffer.append(stderr_line)
-                if stderr_line.endswith('\n'):
-                    f.write(f"[STDERR] {''.join(stderr_buffer)}")
-                    f.flush()
-                    stderr_buffer = []
-            
-            # Write any remaining buffered content
-            if process.poll() is not None:
-                if stdout_buffer:
-                    f.write(f"[STDOUT] {''.join(stdout_buffer)}")
-                if stderr_buffer:
-                    f.write(f"[STDERR] {''.join(stderr_buffer)}")
-                break
-            
-            # If no new output and process ended, break
-            if process.poll() is not None and not stdout_line and not stderr_line:
-                break
+    # Wait on both pipes at once so an idle stream never blocks the other one
+    sel = selectors.DefaultSelector()
+    sel.register(process.stdout, selectors.EVENT_READ, b'[STDOUT] ')
+    sel.register(process.stderr, selectors.EVENT_READ, b'[STDERR] ')
+    # Partial line per stream, until its newline arrives
+    buffers = {b'[STDOUT] ': b'', b'[STDERR] ': b''}
+
+    with open(log_file, 'ab', buffering=1 << 16) as f:
+        while sel.get_map():
+            for key, _ in sel.select(timeout=0.1):
+                tag = key.data
+                chunk = os.read(key.fd, 65536)
+                if not chunk:
+                    # EOF: flush the last partial line of this stream
+                    sel.unregister(key.fileobj)
+                    if buffers[tag]:
+                        f.write(tag + buffers[tag] + b'\n')
+                    continue
+
+                *lines, buffers[tag] = (buffers[tag] + chunk).split(b'\n')
+                f.writelines(tag + line + b'\n' for line in lines)
+            # One flush per wake-up, so the log is up to date if the script is interrupted
+            f.flush()
+    sel.close()
 
 # Initialize log file
 with open(log_file, 'w') as f:
@@ -66,8 +56,6 @@ try:
         [glances_path, '--debug'],
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        universal_newlines=True,
-        bufsize=1,  # Line buffered
         env=env
     )
     
@@ -78,8 +66,9 @@ try:
     log_thread.daemon = True
     log_thread.start()
     
-    # Wait for process to complete
+    # Wait for process to complete, then for the remaining output to be logged
     process.wait()
+    log_thread.join()
     
 except Exception as e:
     with open(log_file, 'a') as f:
@@ -1,6 +1,22 @@
+import io
 import unittest
 import os
+import socket
+import tempfile
+from collections import namedtuple
+from unittest import mock
+
+import psutil
+
 from glances.plugins.network import PluginModel as NetworkPlugin
+from glances.plugins.network import (
+    EMPTY_VENDOR_DB,
+    NET_IF_CACHE_TTL,
+    UNKNOWN_VENDOR,
+    get_vendor_db,
+    load_vendor_database_cache,
+    save_vendor_database_cache,
+)
 
 class MockConfig:
     """Mock configuration for testing."""
@@ -11,46 +27,50 @@ class MockConfig:
         return None
 
 class TestNetworkPlugin(unittest.TestCase):
-    def setUp(self):
-        """Set up test fixtures."""
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures (shared by all the tests of the class)."""
         # Create mock config
         mock_config = MockConfig()
         
         # Initialize plugin with mock config
-        self.plugin = NetworkPlugin(args=None, config=mock_config)
-        self.plugin.debug_mode = True  # Enable debug mode for tests
+        cls.plugin = NetworkPlugin(args=None, config=mock_config)
         
-        # Create a temporary vendor database with real MAC prefixes
-        self.test_db_content = """# Test database with real vendor entries
+        # Vendor database content with real MAC prefixes
+        cls.test_db_content = """# Test database with real vendor entries
 E043DB\tShenzhen ViewAt Technology Co.,Ltd.
-3CD92B\tHewlett Packard"""
+3CD92B\tHewlett Packard
+70B3D5\tIEEE Registration Authority
+70B3D5E\tMA-M Vendor
+70B3D5F2A\tMA-S Vendor"""
         
-        # Write test database to a temporary file
-        self.test_db_path = os.path.join(os.path.dirname(__file__), 'test_ieee_oui.txt')
-        with open(self.test_db_path, 'w') as f:
-            f.write(self.test_db_content)
-
-    def tearDown(self):
-        """Clean up test fixtures."""
-        # Remove temporary test database
-        if os.path.exists(self.test_db_path):
-            os.remove(self.test_db_path)
+        # Parse the test database once for all the tests (from memory, no temporary file)
+        cls.test_db_path = os.path.join(os.path.dirname(__file__), 'test_ieee_oui.txt')
+        cls.vendor_db = cls.plugin.load_vendor_database(io.StringIO(cls.test_db_content))
 
     def test_load_vendor_database(self):
         """Test loading vendor database from file with real vendor entries."""
-        vendor_db = self.plugin.load_vendor_database(self.test_db_path)
+        vendor_db = self.vendor_db
         self.assertEqual(vendor_db['E043DB'], 'Shenzhen ViewAt Technology Co.,Ltd.')
         self.assertEqual(vendor_db['3CD92B'], 'Hewlett Packard')
 
+    def test_load_vendor_database_from_path(self):
+        """Test loading vendor database from a file path."""
+        with tempfile.TemporaryDirectory() as db_dir:
+            db_path = os.path.join(db_dir, 'test_ieee_oui.txt')
+            with open(db_path, 'w') as f:
+                f.write(self.test_db_content)
+            self.assertEqual(self.plugin.load_vendor_database(db_path), self.vendor_db)
+
     def test_get_vendor_exact_match(self):
         """Test vendor lookup with exact MAC prefix match using real vendor data."""
-        vendor_db = self.plugin.load_vendor_database(self.test_db_path)
+        vendor_db = self.vendor_db
         vendor = self.plugin.get_vendor('E0:43:DB:12:34:56', vendor_db)
         self.assertEqual(vendor, 'Shenzhen ViewAt Technology Co.,Ltd.')
 
     def test_get_vendor_case_insensitive(self):
         """Test vendor lookup with different case combinations using real vendor data."""
-        vendor_db = self.plugin.load_vendor_database(self.test_db_path)
+        vendor_db = self.vendor_db
         vendor1 = self.plugin.get_vendor('e0:43:db:12:34:56', vendor_db)
         vendor2 = self.plugin.get_vendor('E0:43:DB:12:34:56', vendor_db)
         self.assertEqual(vendor1, vendor2)
@@ -58,13 +78,13 @@ E043DB\tShenzhen ViewAt Technology Co.,Ltd.
 
     def test_vendor_lookup_with_leading_zeros(self):
         """Test vendor lookup with real MAC addresses that have leading zeros."""
-        vendor_db = self.plugin.load_vendor_database(self.test_db_path)
+        vendor_db = self.vendor_db
         vendor = self.plugin.get_vendor('3C:D9:2B:00:00:00', vendor_db)
         self.assertEqual(vendor, 'Hewlett Packard')
 
     def test_vendor_lookup_different_formats(self):
         """Test vendor lookup with different MAC address formats using real vendor data."""
-        vendor_db = self.plugin.load_vendor_database(self.test_db_path)
+        vendor_db = self.vendor_db
         
         # Test different delimiters
         vendor1 = self.plugin.get_vendor('E0:43:DB:12:34:56', vendor_db)  # Colon
@@ -76,3 +96,137 @@ E043DB\tShenzhen ViewAt Technology Co.,Ltd.
         self.assertEqual(vendor1, vendor2)
         self.assertEqual(vendor2, vendor3)
         self.assertEqual(vendor3, vendor4)
+
+    def test_get_vendor_unknown(self):
+        """Test vendor lookup of unknown or invalid MAC addresses."""
+        self.assertIs(self.plugin.get_vendor('FF:FF:FF:FF:FF:FF', self.vendor_db), UNKNOWN_VENDOR)
+        self.assertIs(self.plugin.get_vendor(None, self.vendor_db), UNKNOWN_VENDOR)
+        self.assertEqual(UNKNOWN_VENDOR, 'Unknown Vendor')
+
+    def test_vendor_lookup_longest_prefix(self):
+        """Test vendor lookup with MA-M (28 bits) and MA-S (36 bits) assignments."""
+        vendor_db = self.vendor_db
+        self.assertEqual(self.plugin.get_vendor('70:B3:D5:F2:A1:23', vendor_db), 'MA-S Vendor')
+        self.assertEqual(self.plugin.get_vendor('70:B3:D5:E1:23:45', vendor_db), 'MA-M Vendor')
+        self.assertEqual(self.plugin.get_vendor('70:B3:D5:01:23:45', vendor_db), 'IEEE Registration Authority')
+
+    def test_debug_log(self):
+        """Test that the debug log is only written when the debug mode is enabled."""
+        plugin = NetworkPlugin(args=None, config=MockConfig())
+        with tempfile.TemporaryDirectory() as log_dir:
+            plugin.debug_log = os.path.join(log_dir, 'logs', 'network_debug.log')
+            plugin.debug_log_write('Debug mode disabled')
+            self.assertFalse(os.path.exists(plugin.debug_log))
+            plugin.debug_mode = True
+            plugin.debug_log_write('Debug mode enabled')
+            with open(plugin.debug_log) as f:
+                self.assertIn('Debug mode enabled', f.read())
+
+    def test_missing_vendor_database(self):
+        """Test that a missing vendor database is not searched again on each call."""
+        with mock.patch('glances.plugins.network.os.path.exists', return_value=False) as exists:
+            self.assertIs(get_vendor_db('missing_ieee_oui.txt'), EMPTY_VENDOR_DB)
+            probes = exists.call_count
+            self.assertIs(get_vendor_db('missing_ieee_oui.txt'), EMPTY_VENDOR_DB)
+            self.assertEqual(exists.call_count, probes)
+
+    def test_vendor_database_cache(self):
+        """Test the binary vendor database cache round trip."""
+        vendor_db = self.vendor_db
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with mock.patch('glances.plugins.network.user_cache_dir', return_value=[cache_dir]):
+                self.assertIsNone(load_vendor_database_cache(self.test_db_path, 1))
+                save_vendor_database_cache(self.test_db_path, 1, vendor_db)
+                self.assertEqual(load_vendor_database_cache(self.test_db_path, 1), vendor_db)
+                # Outdated cache (the source file changed)
+                self.assertIsNone(load_vendor_database_cache(self.test_db_path, 2))
+
+
+# Minimal psutil results used by the update tests
+snetio = namedtuple('snetio', ['bytes_sent', 'bytes_recv'])
+snicstats = namedtuple('snicstats', ['isup', 'speed'])
+snicaddr = namedtuple('snicaddr', ['family', 'address'])
+
+
+class TestNetworkPluginUpdate(unittest.TestCase):
+    """Test the network plugin update with mocked psutil calls and clock."""
+
+    def setUp(self):
+        """Set up the mocked interfaces."""
+        self.clock = 1000.0
+        self.net_io_counters = {'eth0': snetio(1000, 2000), 'eth1': snetio(0, 0)}
+        self.net_if_stats = {'eth0': snicstats(True, 1000), 'eth1': snicstats(True, 0)}
+        self.net_if_addrs = {
+            'eth0': [snicaddr(socket.AF_INET, '192.168.0.2')],
+            'eth1': [snicaddr(socket.AF_INET6, 'fe80::1')],
+        }
+
+        patches = [
+            mock.patch('glances.timer.time', side_effect=lambda: self.clock),
+            mock.patch.object(psutil, 'net_io_counters', side_effect=lambda pernic: dict(self.net_io_counters)),
+            mock.patch.object(psutil, 'net_if_stats', side_effect=lambda: dict(self.net_if_stats)),
+            mock.patch.object(psutil, 'net_if_addrs', side_effect=lambda: dict(self.net_if_addrs)),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        self.plugin = NetworkPlugin(args=None, config=MockConfig())
+
+    def interface_names(self):
+        """Return the names of the interfaces returned by an update."""
+        return sorted(stat['interface_name'] for stat in self.plugin.update())
+
+    def test_net_if_cache_interface_without_status(self):
+        """Test that an interface without status does not refresh the cache on each update."""
+        self.net_io_counters['ghost0'] = snetio(0, 0)
+        for _ in range(4):
+            self.assertEqual(self.interface_names(), ['eth0', 'eth1'])
+        self.assertEqual(psutil.net_if_stats.call_count, 1)
+
+
+    def test_net_if_cache_ttl(self):
+        """Test that the interfaces status is reused within NET_IF_CACHE_TTL and refreshed after."""
+        self.plugin.update()
+        self.clock += NET_IF_CACHE_TTL - 1
+        self.plugin.update()
+        self.assertEqual(psutil.net_if_stats.call_count, 1)
+        self.assertEqual(psutil.net_if_addrs.call_count, 1)
+
+        self.clock += 2
+        self.plugin.update()
+        self.assertEqual(psutil.net_if_stats.call_count, 2)
+        self.assertEqual(psutil.net_if_addrs.call_count, 2)
+
+    def test_net_if_cache_new_interface(self):
+        """Test that a new interface refreshes the cache before NET_IF_CACHE_TTL."""
+        self.assertEqual(self.interface_names(), ['eth0', 'eth1'])
+        self.net_io_counters['eth2'] = snetio(0, 0)
+        self.net_if_stats['eth2'] = snicstats(True, 0)
+        self.net_if_addrs['eth2'] = [snicaddr(socket.AF_INET, '10.0.0.2')]
+        self.assertEqual(self.interface_names(), ['eth0', 'eth1', 'eth2'])
+        self.assertEqual(psutil.net_if_stats.call_count, 2)
+
+    def test_hide_no_up(self):
+        """Test that down interfaces are only dropped when hide_no_up is set."""
+        self.net_if_stats['eth1'] = snicstats(False, 0)
+        self.assertEqual(self.interface_names(), ['eth0', 'eth1'])
+        self.plugin.hide_no_up = True
+        self.assertEqual(self.interface_names(), ['eth0'])
+
+    def test_hide_no_ip(self):
+        """Test that interfaces without IP address are only dropped when hide_no_ip is set."""
+        self.net_if_addrs['eth1'] = []
+        self.assertEqual(self.interface_names(), ['eth0', 'eth1'])
+        self.plugin.hide_no_ip = True
+        self.assertEqual(self.interface_names(), ['eth0'])
+
+    def test_first_update_rates(self):
+        """Test that the first update computes the rates from the counters sampled at init."""
+        self.clock += 2
+        self.net_io_counters['eth0'] = snetio(1000 + 400, 2000 + 600)
+        stats = {stat['interface_name']: stat for stat in self.plugin.update()}
+        self.assertEqual(stats['eth0']['time_since_update'], 2)
+        self.assertEqual(stats['eth0']['bytes_recv_rate_per_sec'], 300)
+        self.assertEqual(stats['eth0']['bytes_sent_rate_per_sec'], 200)
+        self.assertEqual(stats['eth1']['bytes_recv_rate_per_sec'], 0)
@@ -1,5 +1,5 @@
+import io
 import unittest
-import os
 from glances.plugins.network import PluginModel as NetworkPlugin
 
 class MockConfig:
@@ -11,17 +11,17 @@ class MockConfig:
         return None
 
 class TestNetworkPlugin(unittest.TestCase):
-    def setUp(self):
-        """Set up test fixtures."""
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures (shared by all the tests of the class)."""
         # Create mock config
         mock_config = MockConfig()
         
         # Initialize plugin with mock config
-        self.plugin = NetworkPlugin(args=None, config=mock_config)
-        self.plugin.debug_mode = True  # Enable debug mode for tests
+        cls.plugin = NetworkPlugin(args=None, config=mock_config)
         
-        # Create a temporary vendor database with real MAC prefixes
-        self.test_db_content = """# Test database with real vendor entries
+        # Vendor database content with real MAC prefixes
+        cls.test_db_content = """# Test database with real vendor entries
 E043DB\tShenzhen ViewAt Technology Co.,Ltd.
 3CD92B\tHewlett Packard
 0050BA\tD-Link Corporation
@@ -33,18 +33,13 @@ CC46D6\tCisco Systems, Inc
 000347\tIntel Corporation
 000D0B\tBUFFALO.INC
 """
-        self.test_db_path = "test_ieee_oui.txt"
-        with open(self.test_db_path, "w") as f:
-            f.write(self.test_db_content)
-            
-    def tearDown(self):
-        """Clean up test fixtures."""
-        if os.path.exists(self.test_db_path):
-            os.remove(self.test_db_path)
+
+        # Parse the test database once for all the tests (from memory, no temporary file)
+        cls.vendor_db = cls.plugin.load_vendor_database(io.StringIO(cls.test_db_content))
 
     def test_get_vendor_exact_match(self):
         """Test vendor lookup with exact MAC prefix match using real vendor data."""
-        vendor_db = self.plugin.load_vendor_database(self.test_db_path)
+        vendor_db = self.vendor_db
         
         # Test cases with different real MAC address formats
         test_cases = [
@@ -63,7 +58,7 @@ CC46D6\tCisco Systems, Inc
 
     def test_get_vendor_case_insensitive(self):
         """Test vendor lookup with different case combinations using real vendor data."""
-        vendor_db = self.plugin.load_vendor_database(self.test_db_path)
+        vendor_db = self.vendor_db
         
         test_cases = [
             ("00:CD:FE:00:11:22", "Apple, Inc."),                         # Normal case
@@ -80,7 +75,7 @@ CC46D6\tCisco Systems, Inc
 
     def test_load_vendor_database(self):
         """Test loading vendor database from file with real vendor entries."""
-        vendor_db = self.plugin.load_vendor_database(self.test_db_path)
+        vendor_db = self.vendor_db
         
         # Check if all vendors are loaded correctly
         self.assertEqual(len(vendor_db), 10)  # We have 10 real vendor entries
@@ -92,7 +87,7 @@ CC46D6\tCisco Systems, Inc
 
     def test_vendor_lookup_with_leading_zeros(self):
         """Test vendor lookup with real MAC addresses that have leading zeros."""
-        vendor_db = self.plugin.load_vendor_database(self.test_db_path)
+        vendor_db = self.vendor_db
         
         test_cases = [
             ("00:03:47:00:00:00", "Intel Corporation"),    # Intel with full format
@@ -108,7 +103,7 @@ CC46D6\tCisco Systems, Inc
 
     def test_vendor_lookup_different_formats(self):
         """Test vendor lookup with different MAC address formats using real vendor data."""
-        vendor_db = self.plugin.load_vendor_database(self.test_db_path)
+        vendor_db = self.vendor_db
         
         test_cases = [
             ("000D0B123456", "BUFFALO.INC"),              # No separators